@@ -3,12 +3,27 @@
 import asyncio
 import functools
 import inspect
+import itertools
 import logging
+import random
 import socket
+import threading
 import time
+import weakref
 from collections import namedtuple
 from contextlib import AsyncExitStack
-from typing import Any, Callable, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from async_timeout import timeout
 from tenacity import (
@@ -16,8 +31,10 @@ from tenacity import (
     before_log,
     before_sleep_log,
     retry,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,8 +45,24 @@ _KEEP_ALIVE = 1.0  # in seconds
 _VOLUME_SCALE = 100.0
 _MAX_ATTEMPT_TILL_SUCCESS = 10
 _MAX_SEND_MESSAGE_TRIES = 5
+# Wait min(MAX, MULTIPLIER * BASE**attempt) + random(0, JITTER) seconds
+# before retrying, the jitter avoids many speakers reconnecting in lockstep.
+_BACKOFF_MULTIPLIER = 0.2
+_BACKOFF_BASE = 1.5
+_BACKOFF_MAX = 5.0
+_BACKOFF_JITTER = 0.5
 _MAX_CONNECTION_RETRIES = 10  # Each time `_send_command` is called, ...
 # ... the connection is maximally refreshed this many times.
+_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)  # in seconds, the last one is repeated
+_SET_SOURCE_TIMEOUT = 5.0  # in seconds
+_BOOT_TIMEOUT = 20.0  # in seconds, it can take 20s to boot
+_STATE_MAX_AGE = 0.2  # in seconds, reuse a just fetched `State` or volume this long
+_BUFFER_SIZE = 128  # in bytes, a reply is never longer than a few messages
+# After the host turned out to be down, fail right away for this many seconds
+# instead of waiting for yet another connection timeout. The wait doubles
+# every time the host is still down, up to `_OFFLINE_RETRY_MAX`.
+_OFFLINE_RETRY_AFTER = _TIMEOUT
+_OFFLINE_RETRY_MAX = 10.0
 
 # Only in the case of Bluetooth there is a second number
 # that can identify if the bluetooth is connected.
@@ -44,26 +77,32 @@ INPUT_SOURCES_20_MINUTES_LR = {
 
 # We will create {source_name: {standby_time: ("L/R code", "R/L code")}}
 STANDBY_OPTIONS = [20, 60, None]  # in minutes and 0 means never standby
-INPUT_SOURCES = {}
+_input_sources = {}
 for source, code in INPUT_SOURCES_20_MINUTES_LR.items():
     LR_mapping = {t: code + i * 16 for i, t in enumerate(STANDBY_OPTIONS)}
-    INPUT_SOURCES[source] = {t: (LR, LR + 64) for t, LR in LR_mapping.items()}
+    _input_sources[source] = MappingProxyType(
+        {t: (LR, LR + 64) for t, LR in LR_mapping.items()}
+    )
+INPUT_SOURCES = MappingProxyType(_input_sources)
 
-INPUT_SOURCES_RESPONSE = {}
+_input_sources_response = {}
 for source, mapping in INPUT_SOURCES.items():
     source = source.replace("_paired", "")
     for t, (LR, RL) in mapping.items():
-        INPUT_SOURCES_RESPONSE[LR] = (source, t, "L/R")
-        INPUT_SOURCES_RESPONSE[RL] = (source, t, "R/L")
-
-# This seems necessary on both the LSX and LS50W, I don't know why...
-# It's the response when Wifi, "R/L", 60 standby.
-INPUT_SOURCES_RESPONSE[48] = INPUT_SOURCES_RESPONSE[82]
+        _input_sources_response[LR] = (source, t, "L/R")
+        _input_sources_response[RL] = (source, t, "R/L")
+INPUT_SOURCES_RESPONSE = MappingProxyType(_input_sources_response)
 
 _SET_START = ord("S")
 _SET_MID = 129
 _GET_END = 128
 _GET_START = ord("G")
+# A reply to a "get" is "R", which, 129, value, 255, and to a "set" it is "R", 17, 255.
+_REPLY_START = ord("R")
+_REPLY_MID = 129
+_REPLY_END = 255
+_FULL_RESPONSE_OK = bytes([_REPLY_START, _RESPONSE_OK, _REPLY_END])
+_GET_REPLY_SIZE = 5
 
 # Control
 _VOL = ord("%")
@@ -85,34 +124,75 @@ def _get(which: int) -> bytes:
 
 
 def _set(which: int) -> Callable[[int], bytes]:
-    return lambda i: bytes([_SET_START, which, _SET_MID, i])
-
-
-COMMANDS = {
-    "get_volume": _get(_VOL),
-    "set_volume": _set(_VOL),
-    "set_source": _set(_SOURCE),
-    "get_source": _get(_SOURCE),
-    "set_play_pause": _set(_CONTROL)(129),  # 128 also works
-    "get_play_pause": _get(_CONTROL),
-    "next_track": _set(_CONTROL)(130),
-    "prev_track": _set(_CONTROL)(131),
-    "get_mode": _get(_MODE),
-    "set_mode": _set(_MODE),
-    "get_desk_db": _get(_DESK_DB),
-    "set_desk_db": _set(_DESK_DB),
-    "get_wall_db": _get(_WALL_DB),
-    "set_wall_db": _set(_WALL_DB),
-    "get_treble_db": _get(_TREBLE_DB),
-    "set_treble_db": _set(_TREBLE_DB),
-    "get_high_hz": _get(_HIGH_HZ),
-    "set_high_hz": _set(_HIGH_HZ),
-    "get_low_hz": _get(_LOW_HZ),
-    "set_low_hz": _set(_LOW_HZ),
-    "get_sub_db": _get(_SUB_DB),
-    "set_sub_db": _set(_SUB_DB),
+    prefix = bytes([_SET_START, which, _SET_MID])
+    return lambda i: prefix + bytes((i,))
+
+
+# Volume changes are by far the most frequent commands, so build every
+# possible payload (0..127 and +128 for muted) once and index into it.
+_SET_VOLUME_MSGS = tuple(_set(_VOL)(i) for i in range(256))
+
+# {(source, standby_time, inverse_speaker_mode): (message to turn on, message
+# to turn off)}, the speaker is turned off by adding 128 to the source code.
+_SET_SOURCE_MSGS = {
+    (source, t, inverse): (_set(_SOURCE)(code % 128), _set(_SOURCE)(code % 128 + 128))
+    for source, mapping in INPUT_SOURCES.items()
+    for t, codes in mapping.items()
+    for inverse, code in enumerate(codes)
 }
 
+_GET_VOLUME_MSG = _get(_VOL)
+_GET_SOURCE_MSG = _get(_SOURCE)
+
+# The values are either messages or functions that build a message.
+COMMANDS: Mapping[str, Any] = MappingProxyType(
+    {
+        "get_volume": _GET_VOLUME_MSG,
+        "set_volume": _SET_VOLUME_MSGS.__getitem__,
+        "set_source": _set(_SOURCE),
+        "get_source": _GET_SOURCE_MSG,
+        "set_play_pause": _set(_CONTROL)(129),  # 128 also works
+        "get_play_pause": _get(_CONTROL),
+        "next_track": _set(_CONTROL)(130),
+        "prev_track": _set(_CONTROL)(131),
+        "get_mode": _get(_MODE),
+        "set_mode": _set(_MODE),
+        "get_desk_db": _get(_DESK_DB),
+        "set_desk_db": _set(_DESK_DB),
+        "get_wall_db": _get(_WALL_DB),
+        "set_wall_db": _set(_WALL_DB),
+        "get_treble_db": _get(_TREBLE_DB),
+        "set_treble_db": _set(_TREBLE_DB),
+        "get_high_hz": _get(_HIGH_HZ),
+        "set_high_hz": _set(_HIGH_HZ),
+        "get_low_hz": _get(_LOW_HZ),
+        "set_low_hz": _set(_LOW_HZ),
+        "get_sub_db": _get(_SUB_DB),
+        "set_sub_db": _set(_SUB_DB),
+    }
+)
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (starting at 0)."""
+    delay = min(_BACKOFF_MAX, _BACKOFF_MULTIPLIER * _BACKOFF_BASE**attempt)
+    return delay + _BACKOFF_JITTER * random.random()
+
+
+def _poll_schedule(total_time: float) -> Iterator[float]:
+    """Yield the (jittered) delays between consecutive polls.
+
+    Start polling quickly and back off until `_POLL_DELAYS[-1]`, stop
+    when ``total_time`` seconds have been spent waiting."""
+    waited = 0.0
+    delays = itertools.chain(_POLL_DELAYS, itertools.repeat(_POLL_DELAYS[-1]))
+    for delay in delays:
+        if waited >= total_time:
+            return
+        delay *= 1 + 0.25 * random.random()
+        yield delay
+        waited += delay
+
 
 def arange(start, end, step):
     return [x * step for x in range(int(start / step), int(end / step) + 1)]
@@ -136,6 +216,13 @@ DSP_OPTION_MAPPING = {
 
 State = namedtuple("State", ["source", "is_on", "standby_time", "orientation"])
 
+# {response: State} as a list indexed by the response byte of "get_source",
+# if the speaker is off, the source increases by 128.
+_STATE_BY_RESPONSE: List[Optional[State]] = [None] * 256
+for code, (source, t, orientation) in INPUT_SOURCES_RESPONSE.items():
+    _STATE_BY_RESPONSE[code] = State(source, True, t, orientation)
+    _STATE_BY_RESPONSE[code + 128] = State(source, False, t, orientation)
+
 Mode = namedtuple(
     "Mode",
     [
@@ -148,17 +235,37 @@ Mode = namedtuple(
     ],
 )
 
+
+def _if_debug(log_hook: Callable) -> Callable:
+    """Only call the tenacity ``log_hook`` when debug logging is enabled,
+    because it formats its message even if the message is not emitted."""
+
+    def maybe_log(retry_state):
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            log_hook(retry_state)
+
+    return maybe_log
+
+
+class _SpeakerOffline(ConnectionRefusedError):
+    """The speaker did not answer, connecting again is pointless for a while."""
+
+
 _RETRY_KWARGS = {
-    "wait": wait_exponential(exp_base=1.5),
-    "before": before_log(_LOGGER, logging.DEBUG),
-    "before_sleep": before_sleep_log(_LOGGER, logging.DEBUG),
-    "after": after_log(_LOGGER, logging.DEBUG),
+    "wait": wait_exponential(
+        multiplier=_BACKOFF_MULTIPLIER, exp_base=_BACKOFF_BASE, max=_BACKOFF_MAX
+    )
+    + wait_random(0, _BACKOFF_JITTER),
+    "before": _if_debug(before_log(_LOGGER, logging.DEBUG)),
+    "before_sleep": _if_debug(before_sleep_log(_LOGGER, logging.DEBUG)),
+    "after": _if_debug(after_log(_LOGGER, logging.DEBUG)),
 }
+# A `ValueError` means that the arguments are invalid and `_SpeakerOffline`
+# that the speaker is unreachable for a while, retrying will not help.
 _CMD_RETRY_KWARGS = dict(
-    _RETRY_KWARGS, stop=stop_after_attempt(_MAX_ATTEMPT_TILL_SUCCESS)
-)
-_SEND_MSG_RETRY_KWARGS = dict(
-    _RETRY_KWARGS, stop=stop_after_attempt(_MAX_SEND_MESSAGE_TRIES)
+    _RETRY_KWARGS,
+    stop=stop_after_attempt(_MAX_ATTEMPT_TILL_SUCCESS),
+    retry=retry_if_not_exception_type((ValueError, _SpeakerOffline)),
 )
 
 BASS_EXTENSION_MAPPING = {
@@ -206,57 +313,176 @@ def mode_to_bits(mode: Mode) -> int:
     return int(byte, 2)
 
 
+class _IncompleteReply(ConnectionError):
+    """The reply does not contain the response to the message (yet)."""
+
+
+def _iter_frames(reply: bytes) -> Iterator[bytes]:
+    """Yield the complete replies in ``reply``, an incomplete last one is skipped.
+
+    The frames are found by their structure, splitting on "R" does not work
+    because the value of a "get" reply can be 82 (= "R") too."""
+    i = 0
+    while i < len(reply):
+        if reply[i] != _REPLY_START:
+            raise ConnectionError(f"Got an unknown response '{reply!r}'")
+        is_ok = reply[i + 1 : i + 2] == _FULL_RESPONSE_OK[1:2]
+        size = len(_FULL_RESPONSE_OK) if is_ok else _GET_REPLY_SIZE
+        frame = reply[i : i + size]
+        if len(frame) < size:
+            return  # the rest is still on its way
+        if frame[-1] != _REPLY_END or (not is_ok and frame[2] != _REPLY_MID):
+            raise ConnectionError(f"Got an unknown response '{reply!r}'")
+        yield frame
+        i += size
+
+
 def _parse_response(message: bytes, reply: bytes) -> bytes:
     """Sometimes we receive many messages, so we need to split
     them up and choose the right one."""
-    responses = [b"R" + i for i in reply.split(b"R") if i]
-
     if message[0] == ord("G"):
         which = message[1]
-        try:
-            return next(r for r in responses if r[1] == which)
-        except StopIteration:
-            msg = "The query type didn't match with the response."
-            raise Exception(msg) from None
+        for frame in _iter_frames(reply):
+            if len(frame) == _GET_REPLY_SIZE and frame[1] == which:
+                return frame
+        raise _IncompleteReply("The query type didn't match with the response.")
     elif message[0] == ord("S"):
-        FULL_RESPONSE_OK = bytes([82, 17, 255])
-        if FULL_RESPONSE_OK in responses:
-            return FULL_RESPONSE_OK
-        else:
-            raise Exception("Didn't get OK after SET command.")
+        for frame in _iter_frames(reply):
+            if frame == _FULL_RESPONSE_OK:
+                return frame
+        raise _IncompleteReply("Didn't get OK after SET command.")
     else:
         raise Exception(f"Got an unknown response '{reply!r}'")
 
 
+def _create_socket() -> socket.socket:
+    """Create a non-blocking TCP socket that is tuned for tiny messages."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    # Do not let Nagle's algorithm hold back the 3 or 4 byte messages.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+class _KefProtocol(asyncio.BufferedProtocol):
+    """Receive the replies of the speaker directly into a preallocated buffer."""
+
+    __slots__ = (
+        "_loop",
+        "_buffer",
+        "_view",
+        "_nbytes",
+        "_nread",
+        "_waiter",
+        "_lost",
+        "_closed",
+        "transport",
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._buffer = bytearray(_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._nbytes = 0  # bytes received since the last `discard`
+        self._nread = 0  # bytes of those that `read` returned already
+        self._waiter: Optional[asyncio.Future] = None
+        self._lost: Optional[Exception] = None  # why the connection was lost
+        self._closed = loop.create_future()
+        self.transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._nbytes == _BUFFER_SIZE:
+            # Nobody is reading the unsolicited data, so discard it.
+            self.discard()
+        return self._view[self._nbytes :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._nbytes += nbytes
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+        self._lost = exc or ConnectionResetError("Connection closed by the speaker.")
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_exception(self._lost)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    async def read(self) -> bytes:
+        """Wait for new bytes and return all bytes received since `discard`."""
+        if self._nbytes == self._nread:
+            if self._lost is not None:
+                raise self._lost  # no more bytes will come
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        self._nread = self._nbytes
+        return bytes(self._view[: self._nbytes])
+
+    def discard(self) -> None:
+        """Drop stale bytes, e.g., a late reply to a message that timed out."""
+        self._nbytes = self._nread = 0
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+
 class _AsyncCommunicator:
+    __slots__ = (
+        "host",
+        "port",
+        "_loop",
+        "_transport",
+        "_protocol",
+        "_last_time_stamp",
+        "_volume_cache",
+        "_is_online",
+        "_offline_until",
+        "_offline_wait",
+        "_disconnect_handle",
+        "_disconnect_task",
+        "_lock",
+        "__weakref__",  # for `_COMMUNICATORS`
+    )
+
     def __init__(
-        self,
-        host: str,
-        port: int,
-        *,
-        loop: Optional[asyncio.events.AbstractEventLoop] = None,
+        self, host: str, port: int, loop: Optional[asyncio.AbstractEventLoop] = None
     ):
         self.host = host
         self.port = port
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop = loop  # the event loop this is used on, see `_COMMUNICATORS`
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[_KefProtocol] = None
         self._last_time_stamp = 0.0
+        # (time.monotonic(), raw volume), only valid while connected
+        self._volume_cache: Optional[Tuple[float, int]] = None
         self._is_online = False
-        self._loop = loop or asyncio.get_event_loop()
-        self._disconnect_task = None
+        self._offline_until = 0.0
+        self._offline_wait = _OFFLINE_RETRY_AFTER
+        self._disconnect_handle: Optional[asyncio.TimerHandle] = None
+        self._disconnect_task: Optional[asyncio.Future] = None
         self._lock = asyncio.Lock()
 
     @property
     def is_connected(self) -> bool:
-        return (self._reader, self._writer) != (None, None)
+        return (self._transport, self._protocol) != (None, None)
 
     async def open_connection(self) -> None:
+        if time.monotonic() < self._offline_until:
+            raise _SpeakerOffline("Speaker is offline.")
         retries = 0
         while retries < _MAX_CONNECTION_RETRIES:
             try:
-                async with self._lock, timeout(_TIMEOUT):
+                async with self._lock:
                     if self.is_connected:
-                        if self._writer.is_closing():  # type: ignore
+                        if self._transport.is_closing():  # type: ignore
                             _LOGGER.debug(
                                 "%s: Connection closing but did not disconnect",
                                 self.host,
@@ -266,99 +492,197 @@ class _AsyncCommunicator:
                             _LOGGER.debug("%s: Connection is still alive", self.host)
                             return
                     _LOGGER.debug("%s: Opening connection", self.host)
-                    self._reader, self._writer = await asyncio.open_connection(
-                        self.host, self.port, family=socket.AF_INET
-                    )
+                    # Only time the connect, waiting for the lock (held by
+                    # another message in flight) does not mean it's offline.
+                    async with timeout(_TIMEOUT):
+                        await self._connect()
                     _LOGGER.debug("%s: Opening connection successful", self.host)
-            except ConnectionRefusedError:
-                _LOGGER.debug("%s: Opening connection failed", self.host)
-                await asyncio.sleep(0.5)
-            except BlockingIOError:  # Connection incoming
-                # XXX: I have never seen this.
-                _LOGGER.debug("%s: BlockingIOError", self.host)
-                retries = 0
-                await asyncio.sleep(1)
+            except (ConnectionRefusedError, BlockingIOError):
+                # `loop.sock_connect` waits for a non-blocking connect itself, so a
+                # BlockingIOError should not happen, but treat it as a refusal.
+                _LOGGER.debug("%s: Opening connection failed", self.host, exc_info=True)
+                await asyncio.sleep(_backoff(retries))
             except (asyncio.TimeoutError, OSError) as e:  # Host is down
-                self._is_online = False
-                raise ConnectionRefusedError("Speaker is offline.") from e
+                self._mark_offline()
+                raise _SpeakerOffline("Speaker is offline.") from e
             else:
                 self._is_online = True
-                self._last_time_stamp = time.time()
+                self._offline_wait = _OFFLINE_RETRY_AFTER
+                self._last_time_stamp = time.monotonic()
                 self._schedule_disconnect()
                 return
             retries += 1
+        self._mark_offline()
+        raise _SpeakerOffline("Connection tries exceeded.")
+
+    def _mark_offline(self) -> None:
+        """Fail right away for `_offline_wait` seconds and double that wait."""
         self._is_online = False
-        raise ConnectionRefusedError("Connection tries exceeded.")
+        self._offline_until = time.monotonic() + self._offline_wait
+        self._offline_wait = min(2 * self._offline_wait, _OFFLINE_RETRY_MAX)
 
-    async def _send_message(self, message: bytes) -> bytes:  # type: ignore[return]
+    async def _connect(self) -> None:
+        loop = asyncio.get_running_loop()
+        sock = _create_socket()
+        try:
+            await loop.sock_connect(sock, (self.host, self.port))
+            transport, protocol = await loop.create_connection(
+                lambda: _KefProtocol(loop), sock=sock
+            )
+        except BaseException:
+            sock.close()
+            raise
+        self._transport, self._protocol = transport, protocol  # type: ignore
+
+    async def _send_messages(self, messages: Sequence[bytes]) -> List[bytes]:
+        """Send ``messages`` in a single write and return the matching responses.
+
+        Pipelining saves round-trips, but only combine "get" messages of
+        different types, `_parse_response` cannot tell two replies of the same
+        type (or of two "set" messages) apart."""
+        message = b"".join(messages)
         async with self._lock:
-            assert self._writer is not None
-            assert self._reader is not None
-            _LOGGER.debug("%s: Writing message: %s", self.host, str(message))
+            transport, protocol = self._transport, self._protocol
+            assert transport is not None
+            assert protocol is not None
+            _LOGGER.debug("%s: Writing message: %s", self.host, message)
+            protocol.discard()
             try:
                 # I am getting `[asyncio] socket.send() raised exception.`
-                # in one of the two lines below.
+                # in the line below.
                 # After adding this, I've never seen the error again, but also
                 # never seen the log message below...
-                self._writer.write(message)
-                await self._writer.drain()
+                transport.write(message)
             except ConnectionResetError:
                 _LOGGER.exception("%s: Got an exception in writing", self.host)
                 await self._disconnect(use_lock=False)
                 raise
 
             _LOGGER.debug("%s: Reading message", self.host)
+            data = b""
             try:
                 async with timeout(_TIMEOUT):
-                    data = await self._reader.read(100)
-                _LOGGER.debug("%s: Got reply, %s", self.host, str(data))
-                self._last_time_stamp = time.time()
-                self._schedule_disconnect()
+                    while True:
+                        data = await protocol.read()
+                        try:
+                            responses = [_parse_response(m, data) for m in messages]
+                        except _IncompleteReply:
+                            # The reply might arrive in more than one segment,
+                            # anything malformed is raised right away.
+                            _LOGGER.debug("%s: Incomplete reply, %s", self.host, data)
+                        else:
+                            break
             except asyncio.TimeoutError:
                 _LOGGER.error("%s: Timeout in waiting for reply", self.host)
-            else:
-                return data
+                if data:
+                    for m in messages:
+                        _parse_response(m, data)  # raises the reason
+                raise ConnectionError("Timeout in waiting for reply.") from None
+            _LOGGER.debug("%s: Got reply, %s", self.host, data)
+            self._last_time_stamp = time.monotonic()
+            self._schedule_disconnect()
+            return responses
 
     async def _disconnect(self, use_lock=True) -> None:
         _LOGGER.debug("%s: _disconnect called", self.host)
-        self._maybe_cancel_disconnect_task()
+        self._maybe_cancel_disconnect()
         maybe_lock = self._lock if use_lock else AsyncExitStack()
         if self.is_connected:
             async with maybe_lock:  # type: ignore
-                assert self._writer is not None
+                assert self._transport is not None
+                assert self._protocol is not None
                 _LOGGER.debug("%s: Going to disconnect now", self.host)
                 try:
-                    self._writer.close()
-                    await self._writer.wait_closed()
+                    self._transport.close()
+                    await self._protocol.wait_closed()
                     _LOGGER.debug("%s: Disconnected", self.host)
                 except ConnectionResetError:
                     # Raised ConnectionResetError: [Errno 104] Connection reset by peer
                     # which means that the speaker closed the connection.
                     _LOGGER.exception("%s: Disconnecting raised", self.host)
-                self._reader, self._writer = (None, None)
+                self._transport, self._protocol = (None, None)
+                self._volume_cache = None
+
+    async def close(self) -> None:
+        """Cancel the scheduled disconnect and close the connection now."""
+        await self._disconnect()
 
-    async def _disconnect_in(self, dt):
-        await asyncio.sleep(dt)
-        await asyncio.shield(self._disconnect())  # ℹ️ shield it from being cancelled
+    def _disconnect_soon(self):
+        self._disconnect_handle = None
+        # Keep a reference, otherwise the task might be garbage collected.
+        self._disconnect_task = asyncio.ensure_future(self._disconnect())
 
-    def _maybe_cancel_disconnect_task(self):
-        if self._disconnect_task is not None:
-            _LOGGER.debug("%s: Cancelling the _disconnect_task", self.host)
-            self._disconnect_task.cancel()
-            self._disconnect_task = None
+    def _maybe_cancel_disconnect(self):
+        if self._disconnect_handle is not None:
+            _LOGGER.debug("%s: Cancelling the scheduled disconnect", self.host)
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
 
     def _schedule_disconnect(self, dt=_KEEP_ALIVE):
-        self._maybe_cancel_disconnect_task()
-        self._disconnect_task = asyncio.create_task(self._disconnect_in(dt))
+        """(Re)arm a timer that disconnects after ``dt`` seconds of inactivity."""
+        self._maybe_cancel_disconnect()
+        loop = asyncio.get_running_loop()
+        self._disconnect_handle = loop.call_later(dt, self._disconnect_soon)
 
-    @retry(**_SEND_MSG_RETRY_KWARGS)
     async def send_message(self, msg: bytes) -> int:
-        await self.open_connection()
-        raw_reply = await self._send_message(msg)
-        reply = _parse_response(msg, raw_reply)[-2]
-        _LOGGER.debug("%s: Received: %s", self.host, reply)
+        (reply,) = await self.send_messages((msg,))
         return reply
 
+    async def send_messages(  # type: ignore[return]
+        self, msgs: Sequence[bytes]
+    ) -> List[int]:
+        """Send ``msgs`` pipelined (see `_send_messages`) and return their values."""
+        # A plain loop instead of `tenacity.retry` because this is called
+        # for every single message and almost always succeeds right away.
+        for attempt in range(_MAX_SEND_MESSAGE_TRIES):
+            try:
+                transport = self._transport
+                if transport is None or transport.is_closing():
+                    await self.open_connection()
+                reply = [r[-2] for r in await self._send_messages(msgs)]
+            except _SpeakerOffline:
+                raise
+            except Exception:
+                if attempt == _MAX_SEND_MESSAGE_TRIES - 1:
+                    raise
+                delay = _backoff(attempt)
+                _LOGGER.debug(
+                    "%s: Try #%s: Sending %s failed, retrying in %.2f s",
+                    self.host,
+                    attempt,
+                    msgs,
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+            else:
+                _LOGGER.debug("%s: Received: %s", self.host, reply)
+                return reply
+
+
+# All speaker objects that talk to the same speaker share a single
+# connection (and lock) instead of each opening their own. A connection
+# belongs to the event loop that opened it, so they are shared per loop too.
+_CommKey = Tuple[Optional[asyncio.AbstractEventLoop], str, int]
+_COMMUNICATORS: "weakref.WeakValueDictionary[_CommKey, _AsyncCommunicator]"
+_COMMUNICATORS = weakref.WeakValueDictionary()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_communicator(
+    loop: Optional[asyncio.AbstractEventLoop], host: str, port: int
+) -> _AsyncCommunicator:
+    comm = _COMMUNICATORS.get((loop, host, port))
+    if comm is None:
+        comm = _COMMUNICATORS[loop, host, port] = _AsyncCommunicator(host, port, loop)
+    return comm
+
 
 class AsyncKefSpeaker:
     """Asynchronous KEF speaker class.
@@ -376,7 +700,8 @@ class AsyncKefSpeaker:
         The maximum allow volume, between 0 and 1. Use this to avoid
         accidentally setting very high volumes, by default 1.0.
     loop : `asyncio.BaseEventLoop`, optional
-        The eventloop to use.
+        Unused, only kept for backwards compatibility. The speaker always uses
+        the running event loop.
     standby_time: int, optional
         Put the speaker in standby when inactive for ``standby_time``
         minutes. The only options are None (default), 20, and 60.
@@ -390,6 +715,18 @@ class AsyncKefSpeaker:
         For example ``kef_speaker.sync.mute()``.
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "volume_step",
+        "maximum_volume",
+        "standby_time",
+        "inverse_speaker_mode",
+        "_comm_cache",
+        "_state_cache",
+        "sync",
+    )
+
     def __init__(
         self,
         host: str,
@@ -411,38 +748,77 @@ class AsyncKefSpeaker:
         self.maximum_volume = maximum_volume
         self.standby_time = standby_time
         self.inverse_speaker_mode = inverse_speaker_mode
-        self._comm = _AsyncCommunicator(host, port, loop=loop)
+        self._comm_cache: Optional[_AsyncCommunicator] = None
+        self._state_cache: Optional[Tuple[float, State]] = None
         self.sync = SyncKefSpeaker(self)
 
+    @property
+    def _comm(self) -> _AsyncCommunicator:
+        """The connection shared with the other speakers for this host on the
+        running event loop, outside of a loop the one that was used last.
+
+        The communicator of a closed loop is dropped, such that the speaker
+        does not keep that loop alive."""
+        loop = _running_loop()
+        comm = self._comm_cache
+        if (
+            comm is None
+            or (loop is not None and comm._loop is not loop)
+            or (comm._loop is not None and comm._loop.is_closed())
+        ):
+            comm = self._comm_cache = _get_communicator(loop, self.host, self.port)
+        return comm
+
     @retry(**_CMD_RETRY_KWARGS)
     async def get_state(self) -> State:
-        # If the speaker is off, the source increases by 128
-        response = await self._comm.send_message(COMMANDS["get_source"])
-        is_on = response <= 128
-        code = response % 128
-        if code not in INPUT_SOURCES_RESPONSE:
+        response = await self._comm.send_message(_GET_SOURCE_MSG)
+        state = _STATE_BY_RESPONSE[response]
+        if state is None:
             raise ConnectionError(f"Getting source failed, got response {response}.")
-        source, standby_time, orientation = INPUT_SOURCES_RESPONSE[code]
-        return State(source, is_on, standby_time, orientation)
+        self._state_cache = (time.monotonic(), state)
+        return state
+
+    def _recent_state(self) -> Optional[State]:
+        """The `State` from `get_state` if it's younger than `_STATE_MAX_AGE`."""
+        if self._state_cache is not None:
+            fetched_at, state = self._state_cache
+            if time.monotonic() - fetched_at < _STATE_MAX_AGE:
+                return state
+        return None
+
+    async def _cached_state(self) -> State:
+        """The `State` from `get_state` when it's younger than `_STATE_MAX_AGE`,
+        otherwise get the state from the speaker."""
+        return self._recent_state() or await self.get_state()
 
     async def get_source(self) -> None:
-        state = await self.get_state()
+        state = await self._cached_state()
         return state.source
 
     @retry(**_CMD_RETRY_KWARGS)
     async def set_source(self, source: str, *, state="on") -> None:
-        assert source in INPUT_SOURCES
-        i = INPUT_SOURCES[source][self.standby_time][self.inverse_speaker_mode] % 128
-        if state == "off":
-            i += 128
-        response = await self._comm.send_message(
-            COMMANDS["set_source"](i)  # type: ignore
+        msgs = _SET_SOURCE_MSGS.get(
+            (source, self.standby_time, self.inverse_speaker_mode)
         )
+        if msgs is None:
+            raise ValueError(
+                f"Unknown source '{source}', choose from {list(INPUT_SOURCES)}."
+            )
+        orientation = "R/L" if self.inverse_speaker_mode else "L/R"
+        wanted = State(source, state == "on", self.standby_time, orientation)
+        if self._recent_state() == wanted:
+            _LOGGER.debug("%s: Source is already %s", self.host, source)
+            return
+        msg = msgs[state == "off"]
+        self._comm._volume_cache = None
+        self._state_cache = None
+        response = await self._comm.send_message(msg)
         if response != _RESPONSE_OK:
             raise ConnectionError(f"Setting source failed, got response {response}.")
 
-        for i in range(_MAX_ATTEMPT_TILL_SUCCESS):
-            state = await self.get_state()
+        get_state = self.get_state
+        for i, delay in enumerate(_poll_schedule(_SET_SOURCE_TIMEOUT)):
+            state = await get_state()
             current_source = state.source
 
             if (
@@ -459,10 +835,10 @@ class AsyncKefSpeaker:
                 current_source,
                 source,
             )
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(delay)
 
         raise TimeoutError(
-            f"Tried to set {source} {_MAX_ATTEMPT_TILL_SUCCESS} times"
+            f"Tried to set {source} {i + 1} times"
             f" but the speaker is still {current_source}."
         )
 
@@ -471,16 +847,37 @@ class AsyncKefSpeaker:
         self, scale=True
     ) -> Tuple[Union[float, int], bool]:
         """Return volume level (0..1) and is_muted (in a single call)."""
-        volume = await self._comm.send_message(COMMANDS["get_volume"])
+        volume = await self._comm.send_message(_GET_VOLUME_MSG)
         if volume is None:
             raise ConnectionError("Getting volume failed.")
+        self._comm._volume_cache = (time.monotonic(), volume)
         is_muted = volume >= 128
         return volume / _VOLUME_SCALE if scale else volume, is_muted
 
+    @retry(**_CMD_RETRY_KWARGS)
+    async def get_status(self) -> Tuple[State, Union[float, int], bool]:
+        """Return the `State`, volume level (0..1), and is_muted.
+
+        This pipelines the source and volume queries, so it needs a single
+        round-trip instead of calling `get_state` and `get_volume_and_is_muted`."""
+        response, volume = await self._comm.send_messages(
+            (_GET_SOURCE_MSG, _GET_VOLUME_MSG)
+        )
+        state = _STATE_BY_RESPONSE[response]
+        if state is None:
+            raise ConnectionError(f"Getting source failed, got response {response}.")
+        self._state_cache = (time.monotonic(), state)
+        self._comm._volume_cache = (time.monotonic(), volume)
+        return state, volume / _VOLUME_SCALE, volume >= 128
+
     @retry(**_CMD_RETRY_KWARGS)
     async def _set_volume(self, volume: int) -> None:
         # Write volume level (0..100) on index 3,
         # add 128 to current level to mute.
+        if self._recent_volume() == volume:
+            _LOGGER.debug("%s: Volume is already %s", self.host, volume)
+            return
+        self._state_cache = None
         response = await self._comm.send_message(
             COMMANDS["set_volume"](volume)  # type: ignore
         )
@@ -488,6 +885,7 @@ class AsyncKefSpeaker:
             raise ConnectionError(
                 f"Setting the volume failed, got response {response}."
             )
+        self._comm._volume_cache = (time.monotonic(), volume)
 
     @retry(**_CMD_RETRY_KWARGS)
     async def set_play_pause(self) -> None:
@@ -646,13 +1044,15 @@ class AsyncKefSpeaker:
         return volume
 
     async def _change_volume(self, step: float) -> float:
-        """Change volume by `step`."""
-        volume = await self.get_volume()
-        is_muted = await self.is_muted()
-        if is_muted:
-            await self.unmute()
-        assert volume is not None
-        return await self.set_volume(volume + step)
+        """Change volume by `step`, this also unmutes the speaker."""
+        raw_volume = await self._get_raw_volume()
+        # Use integers, with floats e.g. int((0.57 + 0.01) * 100) == 57.
+        maximum = round(self.maximum_volume * _VOLUME_SCALE)
+        volume = max(0, min(maximum, raw_volume % 128 + round(step * _VOLUME_SCALE)))
+        if volume != raw_volume:
+            # Setting a volume without the +128 mute offset unmutes the speaker.
+            await self._set_volume(volume)
+        return volume / _VOLUME_SCALE
 
     async def increase_volume(self) -> float:
         """Increase volume by `self.volume_step`."""
@@ -666,77 +1066,139 @@ class AsyncKefSpeaker:
         _, is_muted = await self.get_volume_and_is_muted(scale=False)
         return is_muted
 
+    def _recent_volume(self) -> Optional[int]:
+        """The raw volume if it was read or set less than `_STATE_MAX_AGE` ago."""
+        cache = self._comm._volume_cache
+        if cache is not None:
+            fetched_at, volume = cache
+            if time.monotonic() - fetched_at < _STATE_MAX_AGE:
+                return volume
+        return None
+
+    async def _get_raw_volume(self) -> int:
+        """Volume level (0..100) plus 128 if muted, without a round-trip
+        if it was read or set less than `_STATE_MAX_AGE` ago."""
+        volume = self._recent_volume()
+        if volume is None:
+            volume, _ = await self.get_volume_and_is_muted(scale=False)
+        return int(volume)
+
     async def mute(self) -> None:
-        volume, _ = await self.get_volume_and_is_muted(scale=False)
-        await self._set_volume(int(volume) % 128 + 128)
+        volume = await self._get_raw_volume()
+        await self._set_volume(volume % 128 + 128)
 
     async def unmute(self) -> None:
-        volume, _ = await self.get_volume_and_is_muted(scale=False)
-        await self._set_volume(int(volume) % 128)
-
-    async def is_online(self) -> bool:  # type: ignore[return]
+        volume = await self._get_raw_volume()
+        await self._set_volume(volume % 128)
+
+    async def is_online(self) -> bool:
+        comm = self._comm
+        if comm._is_online and time.monotonic() - comm._last_time_stamp < _KEEP_ALIVE:
+            # We were talking to the speaker a moment ago.
+            return True
         try:
-            await self._comm.open_connection()
+            await comm.open_connection()
         except ConnectionRefusedError:
-            assert not self._comm._is_online
-        else:
-            return self._comm._is_online
+            assert not comm._is_online
+            return False
+        return comm._is_online
+
+    async def close(self) -> None:
+        """Close the connection, it is reopened by the next command."""
+        await self._comm.close()
+        self._comm_cache = None  # don't keep the event loop alive
 
     async def is_on(self) -> bool:
-        state = await self.get_state()
+        state = await self._cached_state()
         return state.is_on
 
     async def turn_on(self, source: Optional[str] = None) -> None:
         """The speaker can be turned on by selecting an INPUT_SOURCE."""
-        state = await self.get_state()
+        state = await self._cached_state()
         if state.is_on:
             return
         await self.set_source(source or state.source, state="on")
 
-        for i in range(20):  # it can take 20s to boot
-            if await self.is_on():
+        for i, delay in enumerate(_poll_schedule(_BOOT_TIMEOUT)):
+            # The first check can reuse the state that `set_source` just got.
+            state = await (self._cached_state() if i == 0 else self.get_state())
+            if state.is_on:
                 _LOGGER.debug("%s: Speaker is on", self.host)
                 return
             _LOGGER.debug(
                 "%s: Try #%s: Turned on the speaker, but it is still off", self.host, i
             )
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay)
 
     async def turn_off(self) -> None:
-        state = await self.get_state()
+        state = await self._cached_state()
         if not state.is_on:
             return
         await self.set_source(state.source, state="off")
 
-        for i in range(20):  # it can take 20s to boot
-            if not await self.is_on():
+        for i, delay in enumerate(_poll_schedule(_BOOT_TIMEOUT)):
+            state = await (self._cached_state() if i == 0 else self.get_state())
+            if not state.is_on:
                 _LOGGER.debug("%s: Speaker is off", self.host)
                 return
             _LOGGER.debug(
                 "%s: Try #%s: Turned off the speaker, but it is still on", self.host, i
             )
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay)
+
+
+# The event loop that runs the methods of all `SyncKefSpeaker`s. It is shared
+# because the connections in `_COMMUNICATORS` are shared between speakers and
+# must always be used from the same loop.
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return `_SYNC_LOOP`, start it in a daemon thread when used the first time."""
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="aiokef", daemon=True
+            )
+            thread.start()
+            _SYNC_LOOP = loop
+        return _SYNC_LOOP
 
 
 class SyncKefSpeaker:
     """A synchronous KEF speaker class.
 
     This has the same methods as `aiokef.AsyncKefSpeaker`, however, it wraps all async
-    methods and call them in a blocking way."""
+    methods and call them in a blocking way.
+
+    The methods of all synchronous speakers run on one event loop in a background
+    thread that is started on first use, such that the connection to the speaker is
+    reused between calls. Because connections are shared per event loop, the
+    synchronous methods open a connection next to the one of the asynchronous
+    methods, so do not mix them for the same host."""
 
     def __init__(self, async_speaker: AsyncKefSpeaker):
         self.async_speaker = async_speaker
+        # Wrap the coroutine methods once, instead of on every attribute access.
+        for name, _ in inspect.getmembers(
+            type(async_speaker), inspect.iscoroutinefunction
+        ):
+            setattr(self, name, self._make_sync(getattr(async_speaker, name)))
 
-    def __getattr__(self, attr: str) -> Any:
-        method = getattr(self.async_speaker, attr)
-        if method is None:
-            raise AttributeError(f"'SyncKefSpeaker' object has no attribute '{attr}.'")
-        if inspect.iscoroutinefunction(method):
+    def _make_sync(self, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapped(*args, **kwargs):
+            coro = method(*args, **kwargs)
+            return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
 
-            @functools.wraps(method)
-            def wrapped(*args, **kwargs):
-                return asyncio.run(method(*args, **kwargs))
+        return wrapped
 
-            return wrapped
-        else:
-            return method
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes that are not wrapped in `__init__`.
+        value = getattr(self.async_speaker, attr)
+        if value is None:
+            raise AttributeError(f"'SyncKefSpeaker' object has no attribute '{attr}.'")
+        return value
@@ -1,4 +1,405 @@
+import asyncio
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+from async_timeout import timeout
+
+import aiokef
+
+
+class _FakeSpeaker(asyncio.Protocol):
+    """Answers like a KEF speaker that stores whatever is set."""
+
+    def __init__(self, registers, split_at=None, log=None, hang_up=False):
+        self.registers = registers
+        self.split_at = split_at  # send the reply in two parts if not None
+        self.log = log  # a list that all received messages are appended to
+        self.hang_up = hang_up  # close the connection instead of the second part
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        # Pipelined messages arrive in one chunk, "get" is 3 and "set" 4 bytes.
+        reply = b""
+        if self.log is not None:
+            self.log.append(data)
+        while data:
+            if data[0] == ord("G"):
+                which = data[1]
+                reply += bytes([ord("R"), which, 129, self.registers[which], 255])
+                data = data[3:]
+            elif data[0] == ord("S"):
+                self.registers[data[1]] = data[3]
+                reply += bytes([82, 17, 255])
+                data = data[4:]
+        if self.split_at is not None:
+            self.transport.write(reply[: self.split_at])
+            if self.hang_up:
+                self.transport.close()
+                return
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, self.transport.write, reply[self.split_at :])
+        else:
+            self.transport.write(reply)
+
+
+def _run_with_fake_speaker(registers, check, **kwargs):
+    """Run ``await check(speaker)`` with a speaker that talks to a `_FakeSpeaker`."""
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            lambda: _FakeSpeaker(registers, **kwargs), "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            speaker = aiokef.AsyncKefSpeaker("127.0.0.1", port)
+            await check(speaker)
+            await speaker.close()
+
+    asyncio.run(main())
+
+
 def test_import():
     import aiokef
 
     aiokef.AsyncKefSpeaker("localhost")
+
+
+def test_shared_connection():
+    speaker_1 = aiokef.AsyncKefSpeaker("192.168.1.2")
+    speaker_2 = aiokef.AsyncKefSpeaker("192.168.1.2", inverse_speaker_mode=True)
+    assert speaker_1._comm is speaker_2._comm
+    assert speaker_1._comm is not aiokef.AsyncKefSpeaker("192.168.1.3")._comm
+
+
+def test_connection_per_loop():
+    registers = {ord("%"): 30}
+
+    async def main(port):
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            lambda: _FakeSpeaker(registers), "127.0.0.1", port
+        )
+        async with server, timeout(1):
+            port = server.sockets[0].getsockname()[1]
+            speaker = aiokef.AsyncKefSpeaker("127.0.0.1", port)
+            assert await speaker.get_volume() == 0.3
+            return port, speaker._comm
+
+    port, comm = asyncio.run(main(0))
+    # The connection of the first, now closed, loop must not be reused.
+    assert asyncio.run(main(port))[1] is not comm
+
+
+def test_closed_loop_is_released():
+    speaker = aiokef.AsyncKefSpeaker("127.0.0.1", 0)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            lambda: _FakeSpeaker({ord("%"): 30}), "127.0.0.1", 0
+        )
+        async with server, timeout(1):
+            speaker.port = server.sockets[0].getsockname()[1]
+            assert await speaker.get_volume() == 0.3
+            return weakref.ref(loop)
+
+    loop_ref = asyncio.run(main())  # ends without closing the connection
+    assert speaker._comm._loop is None
+    gc.collect()
+    assert loop_ref() is None
+
+
+def test_sync_speaker():
+    speaker = aiokef.AsyncKefSpeaker("192.168.1.4")
+    assert "mute" in vars(speaker.sync)
+    assert speaker.sync.mute.__name__ == "mute"
+    assert speaker.sync.host == "192.168.1.4"
+
+
+def test_poll_schedule():
+    from aiokef.aiokef import _POLL_DELAYS, _poll_schedule
+
+    delays = list(_poll_schedule(5.0))
+    assert delays[0] < delays[1] < delays[2]
+    assert max(delays) <= 1.25 * _POLL_DELAYS[-1]
+    assert 5.0 <= sum(delays) < 5.0 + 1.25 * _POLL_DELAYS[-1]
+
+
+def test_sync_roundtrip():
+    registers = {ord("%"): 30, ord("0"): 2}
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        loop.create_server(lambda: _FakeSpeaker(registers), "127.0.0.1", 0)
+    )
+    port = server.sockets[0].getsockname()[1]
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    try:
+        speaker = aiokef.AsyncKefSpeaker("127.0.0.1", port)
+        assert speaker.sync.get_volume() == 0.3
+        transport = speaker._comm._transport
+        speaker.sync.set_volume(0.4)
+        assert speaker._comm._transport is transport  # reused the connection
+        assert registers[ord("%")] == 40
+        other = aiokef.AsyncKefSpeaker("127.0.0.1", port, inverse_speaker_mode=True)
+        assert other.sync.get_volume() == 0.4
+        # Both speakers share the connection and thus also the loop thread.
+        assert sum(t.name == "aiokef" for t in threading.enumerate()) == 1
+        speaker.sync.close()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def test_volume_roundtrip():
+    registers = {ord("%"): 30}
+
+    async def check(speaker):
+        assert await speaker.get_volume() == 0.3
+        await speaker.set_volume(0.5)
+        assert registers[ord("%")] == 50
+        registers[ord("%")] = 0  # changed with the remote
+        await speaker.set_volume(0.5)  # skipped, it was just set to 0.5
+        assert registers[ord("%")] == 0
+        await asyncio.sleep(0.25)  # the volume we know is now too old
+        await speaker.set_volume(0.5)
+        assert registers[ord("%")] == 50
+        registers[ord("%")] = 20
+        await asyncio.sleep(0.25)  # the volume we know is now too old
+        assert await speaker.increase_volume() == 0.25
+
+    _run_with_fake_speaker(registers, check)
+
+
+def test_maximum_volume():
+    async def check(speaker):
+        speaker = aiokef.AsyncKefSpeaker(
+            speaker.host, speaker.port, maximum_volume=0.57
+        )
+        assert await speaker.increase_volume() == 0.57  # int(0.57 * 100) == 56
+
+    _run_with_fake_speaker({ord("%"): 55}, check)
+
+
+def test_mute_roundtrip():
+    registers = {ord("%"): 50}
+
+    async def check(speaker):
+        await speaker.mute()
+        assert registers[ord("%")] == 50 + 128
+        assert await speaker.is_muted()
+        assert await speaker.get_volume() is None
+        assert await speaker.increase_volume() == 0.55  # also unmutes
+        assert not await speaker.is_muted()
+        await speaker.mute()
+        await speaker.unmute()
+        assert registers[ord("%")] == 55
+
+    _run_with_fake_speaker(registers, check)
+
+
+def test_get_status():
+    registers = {ord("%"): 30 + 128, ord("0"): 2}
+    log = []
+
+    async def check(speaker):
+        state = ("Wifi", True, 20, "L/R")
+        assert await speaker.get_status() == (state, 1.58, True)
+        assert log == [b"G0\x80G%\x80"]  # pipelined in a single write
+        assert await speaker.get_source() == "Wifi"  # from the state cache
+        assert len(log) == 1
+
+    _run_with_fake_speaker(registers, check, log=log)
+
+
+def test_set_source():
+    registers = {ord("%"): 30, ord("0"): 34}  # Wifi without standby
+    log = []
+
+    async def check(speaker):
+        state = await speaker.get_state()
+        assert state.source == "Wifi" and state.is_on
+        await speaker.set_source("Wifi")  # just read, so nothing is sent
+        assert log == [b"G0\x80"]
+        with pytest.raises(ValueError, match="Unknown source"):
+            await speaker.set_source("Radio")  # fails without retrying
+        await speaker.turn_off()
+        assert not await speaker.is_on()
+        await speaker.turn_on()
+        assert await speaker.is_on()
+
+    _run_with_fake_speaker(registers, check, log=log)
+
+
+def test_keep_alive_disconnect():
+    registers = {ord("%"): 30}
+
+    async def check(speaker):
+        await speaker.get_volume()
+        assert speaker._comm.is_connected
+        await asyncio.sleep(1.1)  # disconnects after `_KEEP_ALIVE`
+        assert not speaker._comm.is_connected
+        await speaker.get_volume()
+        await speaker.close()
+        assert not speaker._comm.is_connected
+        assert speaker._comm._disconnect_handle is None
+
+    _run_with_fake_speaker(registers, check)
+
+
+def test_socket_options():
+    import socket
+
+    from aiokef.aiokef import _create_socket
+
+    with _create_socket() as sock:
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        assert not sock.getblocking()
+
+
+def test_parse_response():
+    from aiokef.aiokef import COMMANDS, _parse_response
+
+    msg = COMMANDS["get_volume"]
+    assert _parse_response(msg, b"R%\x81\x1e\xff")[-2] == 30
+    assert _parse_response(msg, b"R0\x81\x02\xffR%\x81\x1e\xff")[-2] == 30
+    # The value can be "R" too.
+    assert _parse_response(msg, b"R%\x81R\xff")[-2] == 82
+    assert _parse_response(COMMANDS["get_source"], b"R0\x81R\xff")[-2] == 82
+    for truncated in (b"R%", b"R%\x81R"):
+        with pytest.raises(Exception, match="didn't match"):
+            _parse_response(msg, truncated)
+    assert _parse_response(COMMANDS["set_volume"](30), b"R\x11\xff")[-2] == 17
+
+
+def test_value_is_r():
+    # 82 is "R", the reply separator that the parser used to split on.
+    registers = {ord("%"): 82, ord("0"): 82}
+
+    async def check(speaker):
+        assert await speaker.get_volume() == 0.82
+        state = await speaker.get_state()
+        assert state == ("Wifi", True, 60, "R/L")
+        # Both replies of the pipelined queries arrive in one chunk.
+        assert await speaker.get_status() == (state, 0.82, False)
+
+    _run_with_fake_speaker(registers, check)
+
+
+def test_backoff():
+    from aiokef.aiokef import _BACKOFF_JITTER, _BACKOFF_MAX, _backoff
+
+    assert _backoff(0) < 0.2 + _BACKOFF_JITTER
+    assert _BACKOFF_MAX <= _backoff(100) <= _BACKOFF_MAX + _BACKOFF_JITTER
+
+
+@pytest.mark.parametrize("split_at", range(1, 5))
+def test_fragmented_reply(split_at):
+    registers = {ord("%"): 82}  # a value of "R"
+
+    async def check(speaker):
+        async with timeout(1):  # a reply that never parses waits for 2 s
+            assert await speaker.get_volume() == 0.82
+            await speaker.set_volume(0.5)
+
+    _run_with_fake_speaker(registers, check, split_at=split_at)
+
+
+def test_connection_lost_mid_reply():
+    async def check(speaker):
+        comm = speaker._comm
+        await comm.open_connection()
+        comm._transport.write(aiokef.aiokef._GET_VOLUME_MSG)
+        await asyncio.sleep(0.1)  # half of the reply and the hang up arrive
+        assert await comm._protocol.read() == b"R%"
+        async with timeout(aiokef.aiokef._TIMEOUT / 4):  # don't wait for more
+            with pytest.raises(ConnectionResetError):
+                await comm._protocol.read()
+
+    _run_with_fake_speaker({ord("%"): 30}, check, split_at=2, hang_up=True)
+
+
+def test_malformed_reply():
+    from aiokef.aiokef import COMMANDS, _IncompleteReply, _parse_response
+
+    msg = COMMANDS["get_volume"]
+    with pytest.raises(ConnectionError, match="unknown response") as e:
+        _parse_response(msg, b"R%\x80\x1e\xff")
+    assert not isinstance(e.value, _IncompleteReply)  # not waited for
+
+
+def test_busy_lock_is_not_offline(monkeypatch):
+    monkeypatch.setattr(aiokef.aiokef, "_TIMEOUT", 0.05)
+
+    async def check(speaker):
+        comm = speaker._comm
+        async with comm._lock:  # e.g., a slow message to the speaker
+            connecting = asyncio.ensure_future(comm.open_connection())
+            await asyncio.sleep(0.2)
+        await connecting
+        assert comm._is_online and comm.is_connected
+
+    _run_with_fake_speaker({}, check)
+
+
+def test_offline_wait(monkeypatch):
+    outcomes = []
+
+    async def _connect(self):
+        outcome = outcomes.pop(0)
+        if outcome == "down":
+            raise OSError("Host is unreachable")
+        elif outcome == "refused":
+            raise ConnectionRefusedError
+
+    monkeypatch.setattr(aiokef.aiokef._AsyncCommunicator, "_connect", _connect)
+    monkeypatch.setattr(aiokef.aiokef, "_backoff", lambda attempt: 0)
+
+    async def main():
+        comm = aiokef.aiokef._AsyncCommunicator("192.168.1.6", 50001)
+        waits = []
+        for _ in range(5):
+            outcomes.append("down")
+            comm._offline_until = 0.0  # skip the wait
+            with pytest.raises(ConnectionRefusedError, match="offline"):
+                await comm.open_connection()
+            waits.append(comm._offline_wait)
+        assert waits == [4.0, 8.0, 10.0, 10.0, 10.0]
+        # Running out of connection tries also counts as being offline.
+        outcomes.extend(["refused"] * aiokef.aiokef._MAX_CONNECTION_RETRIES)
+        comm._offline_until = 0.0
+        with pytest.raises(ConnectionRefusedError, match="tries exceeded"):
+            await comm.open_connection()
+        with pytest.raises(ConnectionRefusedError, match="offline"):
+            await comm.open_connection()  # within the offline window
+        outcomes.append("up")
+        comm._offline_until = 0.0
+        await comm.open_connection()
+        assert comm._is_online
+        assert comm._offline_wait == aiokef.aiokef._OFFLINE_RETRY_AFTER
+        comm._maybe_cancel_disconnect()
+
+    asyncio.run(main())
+
+
+def test_offline_fails_fast():
+    async def main():
+        speaker = aiokef.AsyncKefSpeaker("192.168.1.5")
+        speaker._comm._offline_until = float("inf")  # as if a connect timed out
+        assert not await speaker.is_online()
+        with pytest.raises(ConnectionRefusedError, match="offline"):
+            await speaker._comm.open_connection()
+        # Neither `send_messages` nor the command retries try again.
+        t_start = time.monotonic()
+        with pytest.raises(ConnectionRefusedError, match="offline"):
+            await speaker.get_state()
+        with pytest.raises(ConnectionRefusedError, match="offline"):
+            await speaker.set_volume(0.5)
+        assert time.monotonic() - t_start < aiokef.aiokef._TIMEOUT / 4
+
+    asyncio.run(main())